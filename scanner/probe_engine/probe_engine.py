@@ -13,6 +13,25 @@ from .vector_weaknesses_probes import VectorWeaknessProbe
 from .misinformation_probes import MisinformationProbe
 from .consumption_probes import UnboundedConsumptionProbe
 
+class ScanResults(list):
+    """Probe findings plus a precomputed vulnerability-type index.
+
+    Subclasses list so existing callers that iterate, len() or serialize
+    the results keep working; vuln_types answers "did the scan surface
+    type X" in O(1) instead of re-walking every finding.
+    """
+
+    _vuln_types: Optional[frozenset] = None
+
+    @property
+    def vuln_types(self) -> frozenset:
+        if self._vuln_types is None:
+            self._vuln_types = frozenset(
+                finding.get("vulnerability_type") for finding in self
+            )
+        return self._vuln_types
+
+
 class ProbeEngine:
     """Manages and executes OWASP LLM vulnerability probes"""
 
@@ -75,9 +94,9 @@ class ProbeEngine:
         """Register a new probe"""
         self.probes.append(probe)
 
-    async def run_scan(self, target: Any) -> List[Dict[str, Any]]:
+    async def run_scan(self, target: Any) -> ScanResults:
         """Run all registered probes against the target"""
-        self.results = []
+        self.results = ScanResults()
         
         for probe in self.probes:
             try:
@@ -1,23 +1,94 @@
 from typing import Dict, Any
+import asyncio
+import time
+import httpx
 import openai
 from .base_target import BaseLLMTarget
 from ..utils.retry import async_retry
+from ..utils.rate_limiter import AsyncTokenBucket
 from openai import BadRequestError, RateLimitError as OpenAIRateLimitError
 
+# Module-level limiters shared by all OpenAI targets: one for
+# requests/minute, one weighted by token usage for tokens/minute
+_request_limiter = AsyncTokenBucket(max_rate=3000, time_period=60)
+_token_limiter = AsyncTokenBucket(max_rate=250_000, time_period=60)
+
+# Assumed per-request token cost when the caller doesn't cap max_tokens
+_DEFAULT_TOKEN_COST = 512
+
 class OpenAITarget(BaseLLMTarget):
     """OpenAI API target"""
-    
+
+    # How long a cached models.list() lookup stays valid (seconds)
+    MODEL_INFO_TTL = 3600
+
+    # Shared AsyncOpenAI clients keyed by (api_key, organization, loop)
+    # so scans that build many targets reuse one connection pool instead
+    # of paying a fresh TCP/TLS handshake per instance. The loop is part
+    # of the key because the CLI runs one asyncio.run() per scan, and a
+    # pool whose connections were created on a closed loop fails at
+    # request time
+    _clients: Dict[tuple, openai.AsyncOpenAI] = {}
+
     def __init__(
-        self, 
-        api_key: str, 
+        self,
+        api_key: str,
         model: str = "gpt-3.5-turbo",
         organization: str = None
     ):
-        self.client = openai.AsyncOpenAI(
-            api_key=api_key,
-            organization=organization
-        )
+        self.client = self._get_client(api_key, organization)
         self.model = model
+        self._model_info_cache = None
+        self._model_info_expires = 0.0
+
+    @classmethod
+    def _get_client(cls, api_key: str, organization: str = None) -> openai.AsyncOpenAI:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Constructed outside any loop (sync setup code); the entry
+            # is evicted like any other once a real loop key exists
+            loop = None
+        key = (api_key, organization, loop)
+        client = cls._clients.get(key)
+        if client is None:
+            # Drop pools owned by loops that have since closed; their
+            # connections are unusable and only pin memory
+            for stale_key in [
+                k for k in cls._clients
+                if k[2] is not None and k[2].is_closed()
+            ]:
+                del cls._clients[stale_key]
+            client = openai.AsyncOpenAI(
+                api_key=api_key,
+                organization=organization,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=50
+                    ),
+                    timeout=30
+                )
+            )
+            cls._clients[key] = client
+        return client
+
+    @classmethod
+    def reset_clients(cls):
+        """Drop cached clients without closing them.
+
+        Test hook: fixtures that monkeypatch openai.AsyncOpenAI must
+        reset the cache so a stale (real or mocked) client from an
+        earlier test isn't reused.
+        """
+        cls._clients.clear()
+
+    @classmethod
+    async def close_clients(cls):
+        """Close all shared clients (call on application shutdown)"""
+        clients, cls._clients = cls._clients, {}
+        for client in clients.values():
+            await client.close()
 
     @async_retry(retries=3)
     async def get_completion(
@@ -27,6 +98,9 @@ class OpenAITarget(BaseLLMTarget):
         temperature: float = 0.7,
         **kwargs
     ) -> str:
+        token_cost = max_tokens or _DEFAULT_TOKEN_COST
+        await _request_limiter.acquire()
+        await _token_limiter.acquire(token_cost)
         try:
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -37,6 +111,9 @@ class OpenAITarget(BaseLLMTarget):
             )
             return response.choices[0].message.content
         except OpenAIRateLimitError as e:
+            # We still hit the provider's limit - drain the bucket so
+            # concurrent callers back off instead of thrashing on 429s
+            await _token_limiter.penalize(token_cost)
             raise RateLimitError(str(e))
         except BadRequestError as e:
             raise self.map_provider_error(e)
@@ -44,13 +121,21 @@ class OpenAITarget(BaseLLMTarget):
             raise LLMProviderError(f"OpenAI error: {str(e)}")
 
     async def get_model_info(self) -> Dict[str, Any]:
+        # models.list() is a full network round-trip; cache the result so
+        # repeated probes against the same target don't pay it every call
+        now = time.monotonic()
+        if self._model_info_cache is not None and now < self._model_info_expires:
+            return self._model_info_cache
+
         models = await self.client.models.list()
-        model_info = next(
-            (m for m in models.data if m.id == self.model),
-            None
-        )
-        return {
+        by_id = {m.id: m for m in models.data}
+        model_info = by_id.get(self.model)
+
+        info = {
             "provider": "openai",
             "model": self.model,
             "capabilities": model_info.dict() if model_info else {}
-        } 
\ No newline at end of file
+        }
+        self._model_info_cache = info
+        self._model_info_expires = now + self.MODEL_INFO_TTL
+        return info 
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import List, Dict, Any, Optional
 import asyncio
 from ..probe_engine.probe_engine import ProbeEngine
 from ..targets import create_target
+from ..targets.openai_target import OpenAITarget
 from ..reporting.security_report import SecurityReportGenerator
 from .auth import oauth, get_current_user, create_access_token
 from starlette.responses import RedirectResponse
@@ -14,11 +15,13 @@ from .user_management import UserManager
 from .models.profile import UserProfile, ProfileUpdate
 from .models.organization import Organization, Team, TeamRole
 from .audit import AuditLogger
+from .scan_routing import new_scan_id
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from .audit_report import AuditReportGenerator
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from ..utils.version_checker import VersionChecker
+from ..utils.admission import AdmissionController
 import uvicorn
 
 app = FastAPI(title="LLM Security Scanner API")
@@ -28,6 +31,11 @@ async def startup_event():
     """Check versions on startup"""
     VersionChecker.check_and_warn("fastapi")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared provider connection pools"""
+    await OpenAITarget.close_clients()
+
 class ScanRequest(BaseModel):
     target_url: str
     api_key: str
@@ -43,6 +51,10 @@ class ScanResponse(BaseModel):
 # Store scan results in memory (replace with database in production)
 scan_results = {}
 
+# Cap concurrent scans so a burst can't saturate the event loop or the
+# upstream LLM APIs; resizable at runtime via the admin endpoint
+scan_admission = AdmissionController(max_active=10)
+
 # Store active websocket connections
 websocket_connections: Dict[str, WebSocket] = {}
 
@@ -85,7 +97,7 @@ async def start_scan(
     background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user)
 ):
-    scan_id = f"scan_{user.id}_{len(scan_results) + 1}"
+    scan_id = f"scan_{user.id}_{new_scan_id()}"
     scan_results[scan_id] = {"status": "running"}
     
     background_tasks.add_task(
@@ -109,6 +121,18 @@ async def get_scan_results(scan_id: str):
         **scan_results[scan_id]
     }
 
+@app.post("/admin/scan-concurrency")
+@requires_permission(Permission.CONFIG_MANAGE)
+async def set_scan_concurrency(
+    max_active: int,
+    user: User = Depends(get_current_user)
+):
+    """Resize the concurrent scan cap at runtime"""
+    if max_active < 1:
+        raise HTTPException(status_code=400, detail="max_active must be >= 1")
+    await scan_admission.resize(max_active)
+    return {"max_active": max_active, "active": scan_admission.active}
+
 @app.websocket("/ws/{scan_id}")
 async def websocket_endpoint(websocket: WebSocket, scan_id: str):
     await websocket.accept()
@@ -145,9 +169,10 @@ async def run_scan(
             **(provider_options or {})
         )
         
-        # Run scan
+        # Run scan under the global admission cap
         engine = ProbeEngine(enabled_vulnerabilities=vulnerabilities)
-        results = await engine.run_scan(target)
+        async with scan_admission:
+            results = await engine.run_scan(target)
         
         # Generate report
         generator = SecurityReportGenerator()
@@ -282,22 +307,22 @@ async def generate_audit_report(
     user: User = Depends(get_current_user)
 ):
     """Generate audit report"""
-    # Parse dates
-    start = datetime.fromisoformat(start_date) if start_date else datetime.now() - timedelta(days=30)
-    end = datetime.fromisoformat(end_date) if end_date else datetime.now()
+    # Parse dates (UTC so no per-request local-timezone lookup)
+    start = datetime.fromisoformat(start_date) if start_date else datetime.now(timezone.utc) - timedelta(days=30)
+    end = datetime.fromisoformat(end_date) if end_date else datetime.now(timezone.utc)
     
     # Parse user IDs (comma-separated)
     users = user_ids.split(",") if user_ids else None
     
-    # Generate report
+    # Generate report data; HTML rendering is streamed below
     report = await audit_report_generator.generate_report(
         start_date=start,
         end_date=end,
         user_ids=users,
         organization_id=organization_id,
-        format=format
+        format="json"
     )
-    
+
     # Log report generation
     await audit_logger.log_action(
         user=user,
@@ -305,9 +330,11 @@ async def generate_audit_report(
         resource="audit/report",
         details={"start_date": start_date, "end_date": end_date}
     )
-    
+
     # Return appropriate format
-    if format == "json":
+    if format == "json" or "error" in report:
         return JSONResponse(content=report)
-    else:
-        return HTMLResponse(content=report) 
\ No newline at end of file
+    return StreamingResponse(
+        audit_report_generator.stream_html(report),
+        media_type="text/html"
+    ) 
\ No newline at end of file
@@ -1,10 +1,21 @@
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
 from pathlib import Path
 from .auth import User
 
+# Cached tz object: datetime.now(_UTC) skips the local-timezone lookup
+# that plain datetime.now() performs on every call
+_UTC = timezone.utc
+
+def ensure_utc(dt: datetime) -> datetime:
+    """Treat naive datetimes (e.g. from older log entries) as UTC"""
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=_UTC)
+
 class AuditLogger:
     """Audit logger for user actions"""
     
@@ -16,16 +27,23 @@ class AuditLogger:
         self.logger = logging.getLogger("audit")
         self.logger.setLevel(logging.INFO)
         
-        # Create rotating file handler
-        handler = logging.FileHandler(
+        # File writes happen on a background thread via a queue so
+        # log_action never blocks the event loop on disk I/O
+        file_handler = logging.FileHandler(
             self.log_dir / f"audit_{datetime.now().strftime('%Y%m')}.log"
         )
-        handler.setFormatter(
+        file_handler.setFormatter(
             logging.Formatter(
                 '%(asctime)s - %(levelname)s - %(message)s'
             )
         )
-        self.logger.addHandler(handler)
+        self._log_queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, file_handler
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
 
     async def log_action(
         self,
@@ -37,7 +55,7 @@ class AuditLogger:
     ):
         """Log user action"""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(_UTC).isoformat(),
             "user_id": user.id,
             "user_email": user.email,
             "action": action,
@@ -70,10 +88,10 @@ class AuditLogger:
                         if entry["user_id"] != user_id:
                             continue
                             
-                        timestamp = datetime.fromisoformat(entry["timestamp"])
-                        if start_date and timestamp < start_date:
+                        timestamp = ensure_utc(datetime.fromisoformat(entry["timestamp"]))
+                        if start_date and timestamp < ensure_utc(start_date):
                             continue
-                        if end_date and timestamp > end_date:
+                        if end_date and timestamp > ensure_utc(end_date):
                             continue
                         if action_type and entry["action"] != action_type:
                             continue
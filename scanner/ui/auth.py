@@ -5,6 +5,9 @@ from starlette.requests import Request
 from starlette.responses import RedirectResponse
 from authlib.integrations.starlette_client import OAuth, OAuthError
 import jwt
+import time
+from functools import lru_cache
+from types import SimpleNamespace
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
@@ -29,6 +32,28 @@ class User:
         self.provider = provider
         self.role = role
 
+    @property
+    def role(self) -> UserRole:
+        return self._role
+
+    @role.setter
+    def role(self, value: UserRole):
+        self._role = value
+        # Permission decisions memoized on this object derive from the
+        # role; drop them so a role change (e.g. revocation via
+        # UserManager.update_user) takes effect immediately
+        self.__dict__.pop("_perm_cache", None)
+
+    def to_dict(self) -> dict:
+        """JSON-safe representation (enum role flattened to its value)"""
+        return {
+            "id": self.id,
+            "email": self.email,
+            "name": self.name,
+            "provider": self.provider,
+            "role": self.role.value if isinstance(self.role, UserRole) else self.role
+        }
+
 # Load config
 config = Config(".env")
 oauth = OAuth()
@@ -79,6 +104,17 @@ def create_access_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> dict:
+    """Verify and decode a JWT once per distinct token.
+
+    Tokens repeat across a session, so caching the verified payload skips
+    the HMAC + JSON parse on every request. Expiry is re-checked by the
+    caller against the cached "exp" claim, so a stale cache entry can
+    never outlive its token.
+    """
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
 async def get_current_user(request: Request):
     token = request.cookies.get("access_token")
     if not token:
@@ -87,8 +123,16 @@ async def get_current_user(request: Request):
             detail="Not authenticated"
         )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = _decode_token(token)
+        if payload.get("exp", 0) <= time.time():
+            raise jwt.ExpiredSignatureError("Token expired")
+        # Hand out a fresh principal per request: the cached payload
+        # dict is shared across requests and must not escape mutable,
+        # and the namespace gives the permission layer a place for its
+        # request-scoped memo (see rbac.requires_permission)
+        principal = SimpleNamespace(**payload)
+        principal._perm_cache = {}
+        return principal
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,28 +1,37 @@
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from enum import Enum
-
-class TeamRole(Enum):
-    OWNER = "owner"
-    ADMIN = "admin"
-    MEMBER = "member"
-
-class Team(BaseModel):
-    id: str
-    name: str
-    organization_id: str
-    description: Optional[str] = None
-    members: Dict[str, TeamRole] = {}  # user_id: role
-    created_at: datetime
-    updated_at: datetime
-
-class Organization(BaseModel):
-    id: str
-    name: str
-    description: Optional[str] = None
-    teams: Dict[str, Team] = {}
-    members: Dict[str, TeamRole] = {}
-    settings: Dict[str, Any] = {}
-    created_at: datetime
-    updated_at: datetime 
\ No newline at end of file
+import sys
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any
+from datetime import datetime
+from enum import Enum
+
+# slots landed in dataclasses in 3.10; stay importable on older runtimes
+_DC_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+class TeamRole(Enum):
+    OWNER = "owner"
+    ADMIN = "admin"
+    MEMBER = "member"
+
+# Plain slotted dataclasses: these are built server-side from trusted
+# data, so pydantic's per-field validation was pure overhead
+
+@dataclass(**_DC_OPTS)
+class Team:
+    id: str
+    name: str
+    organization_id: str
+    created_at: datetime
+    updated_at: datetime
+    description: Optional[str] = None
+    members: Dict[str, TeamRole] = field(default_factory=dict)  # user_id: role
+
+@dataclass(**_DC_OPTS)
+class Organization:
+    id: str
+    name: str
+    created_at: datetime
+    updated_at: datetime
+    description: Optional[str] = None
+    teams: Dict[str, Team] = field(default_factory=dict)
+    members: Dict[str, TeamRole] = field(default_factory=dict)
+    settings: Dict[str, Any] = field(default_factory=dict)
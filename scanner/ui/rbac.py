@@ -1,59 +1,101 @@
-from typing import List, Set
-from enum import Enum
-from functools import wraps
-from fastapi import HTTPException, status
-from .auth import UserRole, User
-
-class Permission(Enum):
-    SCAN_RUN = "scan:run"
-    SCAN_VIEW = "scan:view"
-    CONFIG_MANAGE = "config:manage"
-    USER_MANAGE = "user:manage"
-    REPORT_GENERATE = "report:generate"
-    ALERT_MANAGE = "alert:manage"
-
-# Role-based permissions
-ROLE_PERMISSIONS = {
-    UserRole.ADMIN: {
-        Permission.SCAN_RUN,
-        Permission.SCAN_VIEW,
-        Permission.CONFIG_MANAGE,
-        Permission.USER_MANAGE,
-        Permission.REPORT_GENERATE,
-        Permission.ALERT_MANAGE
-    },
-    UserRole.USER: {
-        Permission.SCAN_RUN,
-        Permission.SCAN_VIEW,
-        Permission.CONFIG_MANAGE,
-        Permission.REPORT_GENERATE
-    },
-    UserRole.AUDITOR: {
-        Permission.SCAN_VIEW,
-        Permission.REPORT_GENERATE
-    }
-}
-
-def requires_permission(permission: Permission):
-    """Decorator to check permission"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, user: User, **kwargs):
-            if not has_permission(user, permission):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Permission denied: {permission.value}"
-                )
-            return await func(*args, user=user, **kwargs)
-        return wrapper
-    return decorator
-
-def has_permission(user: User, permission: Permission) -> bool:
-    """Check if user has permission"""
-    if not user or not user.role:
-        return False
-    return permission in ROLE_PERMISSIONS.get(user.role, set())
-
-def get_user_permissions(user: User) -> Set[Permission]:
-    """Get all permissions for user"""
-    return ROLE_PERMISSIONS.get(user.role, set()) 
\ No newline at end of file
+from enum import IntFlag, auto
+from functools import lru_cache, wraps
+from fastapi import HTTPException, status
+from .auth import UserRole, User
+
+class Permission(IntFlag):
+    SCAN_RUN = auto()
+    SCAN_VIEW = auto()
+    CONFIG_MANAGE = auto()
+    USER_MANAGE = auto()
+    REPORT_GENERATE = auto()
+    ALERT_MANAGE = auto()
+
+# Human-readable labels for error messages and API responses
+# (Permission values are bit flags now, not strings)
+PERMISSION_LABELS = {
+    Permission.SCAN_RUN: "scan:run",
+    Permission.SCAN_VIEW: "scan:view",
+    Permission.CONFIG_MANAGE: "config:manage",
+    Permission.USER_MANAGE: "user:manage",
+    Permission.REPORT_GENERATE: "report:generate",
+    Permission.ALERT_MANAGE: "alert:manage",
+}
+
+NO_PERMISSIONS = Permission(0)
+
+# Role-based permissions: each role maps to a single combined flag, so a
+# permission check is one dict lookup and one integer AND
+ROLE_PERMISSIONS = {
+    UserRole.ADMIN: (
+        Permission.SCAN_RUN
+        | Permission.SCAN_VIEW
+        | Permission.CONFIG_MANAGE
+        | Permission.USER_MANAGE
+        | Permission.REPORT_GENERATE
+        | Permission.ALERT_MANAGE
+    ),
+    UserRole.USER: (
+        Permission.SCAN_RUN
+        | Permission.SCAN_VIEW
+        | Permission.CONFIG_MANAGE
+        | Permission.REPORT_GENERATE
+    ),
+    UserRole.AUDITOR: (
+        Permission.SCAN_VIEW
+        | Permission.REPORT_GENERATE
+    )
+}
+
+def requires_permission(permission: Permission):
+    """Decorator to check permission"""
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, user: User, **kwargs):
+            # Memo so stacked decorators and bulk endpoints that re-check
+            # the same permission pay for it once. get_current_user
+            # attaches a fresh cache to each request's principal; for
+            # long-lived User objects the role setter invalidates it on
+            # role changes
+            cache = getattr(user, "_perm_cache", None)
+            if cache is None:
+                cache = {}
+                try:
+                    user._perm_cache = cache
+                except AttributeError:
+                    pass
+            allowed = cache.get(permission)
+            if allowed is None:
+                allowed = has_permission(user, permission)
+                cache[permission] = allowed
+            if not allowed:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail=f"Permission denied: {PERMISSION_LABELS.get(permission, permission.name)}"
+                )
+            return await func(*args, user=user, **kwargs)
+        return wrapper
+    return decorator
+
+@lru_cache(maxsize=64)
+def _role_has(role: UserRole, permission: Permission) -> bool:
+    """Memoized (role, permission) answer; only a handful of keys exist"""
+    return bool(ROLE_PERMISSIONS.get(role, NO_PERMISSIONS) & permission)
+
+def has_permission(user: User, permission: Permission) -> bool:
+    """Check if user has permission"""
+    # Principals built from a JWT payload may carry no role claim at
+    # all; treat that as no permissions rather than raising
+    role = getattr(user, "role", None) if user else None
+    if not role:
+        return False
+    return _role_has(role, permission)
+
+@lru_cache(maxsize=8)
+def _perms_for_role(role: UserRole) -> Permission:
+    """Per-role lookup cached across calls (roles are static)"""
+    return ROLE_PERMISSIONS.get(role, NO_PERMISSIONS)
+
+def get_user_permissions(user: User) -> Permission:
+    """Get the combined permission flags for user"""
+    return _perms_for_role(user.role)
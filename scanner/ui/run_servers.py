@@ -1,34 +1,51 @@
-import subprocess
-import sys
-from ..utils.version_checker import VersionChecker
-
-def run_servers():
-    """Start both FastAPI and Streamlit servers"""
-    # Check versions before starting
-    if not VersionChecker.check_and_warn():
-        print("Fix package versions before continuing")
-        sys.exit(1)
-        
-    try:
-        # Start FastAPI server
-        api_process = subprocess.Popen(
-            ["uvicorn", "scanner.ui.api:app", "--host", "0.0.0.0", "--port", "8000"]
-        )
-        
-        # Start Streamlit server
-        streamlit_process = subprocess.Popen(
-            ["streamlit", "run", "scanner/ui/streamlit_app.py"]
-        )
-        
-        # Wait for both processes
-        api_process.wait()
-        streamlit_process.wait()
-        
-    except KeyboardInterrupt:
-        print("\nShutting down servers...")
-        api_process.terminate()
-        streamlit_process.terminate()
-        sys.exit(0)
-
-if __name__ == "__main__":
-    run_servers() 
\ No newline at end of file
+import asyncio
+import shutil
+import signal
+import sys
+from ..utils.version_checker import VersionChecker
+
+# Resolve the executables once instead of re-walking PATH per spawn
+UVICORN = shutil.which("uvicorn")
+STREAMLIT = shutil.which("streamlit")
+
+async def _run():
+    """Run both servers and wait on them concurrently"""
+    api_process = await asyncio.create_subprocess_exec(
+        UVICORN, "scanner.ui.api:app", "--host", "0.0.0.0", "--port", "8000"
+    )
+    streamlit_process = await asyncio.create_subprocess_exec(
+        STREAMLIT, "run", "scanner/ui/streamlit_app.py"
+    )
+
+    processes = [api_process, streamlit_process]
+
+    def _terminate():
+        print("\nShutting down servers...")
+        for process in processes:
+            if process.returncode is None:
+                process.terminate()
+
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, _terminate)
+    loop.add_signal_handler(signal.SIGTERM, _terminate)
+
+    # Waiting on both at once: previously the serial .wait() calls meant
+    # the second process was never monitored until the first exited
+    await asyncio.gather(*(process.wait() for process in processes))
+
+def run_servers():
+    """Start both FastAPI and Streamlit servers"""
+    # Check versions before starting
+    if not VersionChecker.check_and_warn():
+        print("Fix package versions before continuing")
+        sys.exit(1)
+
+    for name, path in (("uvicorn", UVICORN), ("streamlit", STREAMLIT)):
+        if not path:
+            print(f"{name} not found on PATH")
+            sys.exit(1)
+
+    asyncio.run(_run())
+
+if __name__ == "__main__":
+    run_servers()
@@ -0,0 +1,5 @@
+from uuid import uuid4
+
+def new_scan_id() -> str:
+    """Create a unique scan id"""
+    return uuid4().hex
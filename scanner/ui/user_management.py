@@ -1,70 +1,124 @@
-from typing import Dict, Optional, List
-from .auth import User, UserRole
-import json
-from pathlib import Path
-
-class UserManager:
-    def __init__(self, storage_path: Optional[Path] = None):
-        self.storage_path = storage_path or Path("users.json")
-        self.users: Dict[str, User] = {}
-        self.load_users()
-
-    def load_users(self):
-        """Load users from storage"""
-        if self.storage_path.exists():
-            with open(self.storage_path) as f:
-                data = json.load(f)
-                self.users = {
-                    id: User(**user_data)
-                    for id, user_data in data.items()
-                }
-
-    def save_users(self):
-        """Save users to storage"""
-        with open(self.storage_path, 'w') as f:
-            json.dump(
-                {
-                    id: user.__dict__
-                    for id, user in self.users.items()
-                },
-                f,
-                indent=2
-            )
-
-    def get_user(self, user_id: str) -> Optional[User]:
-        """Get user by ID"""
-        return self.users.get(user_id)
-
-    def create_user(self, user: User) -> User:
-        """Create new user"""
-        if user.id in self.users:
-            raise ValueError(f"User {user.id} already exists")
-        self.users[user.id] = user
-        self.save_users()
-        return user
-
-    def update_user(self, user_id: str, **updates) -> User:
-        """Update user"""
-        if user_id not in self.users:
-            raise ValueError(f"User {user_id} not found")
-        
-        user = self.users[user_id]
-        for key, value in updates.items():
-            if hasattr(user, key):
-                setattr(user, key, value)
-        
-        self.save_users()
-        return user
-
-    def delete_user(self, user_id: str):
-        """Delete user"""
-        if user_id in self.users:
-            del self.users[user_id]
-            self.save_users()
-
-    def get_users_by_role(self, role: UserRole) -> List[User]:
-        """Get users by role"""
-        return [
-            user for user in self.users.values()
-            if user.role == role
-        ] 
\ No newline at end of file
+from typing import Dict, Optional, List
+from .auth import User, UserRole
+import json
+import orjson
+import sqlite3
+import threading
+from pathlib import Path
+
+class UserManager:
+    def __init__(self, storage_path: Optional[Path] = None):
+        self.storage_path = storage_path or Path("users.db")
+        # autocommit mode: each statement is its own transaction, so a
+        # mutation costs one row write instead of rewriting every user.
+        # Endpoint handlers run on worker threads, so the connection must
+        # allow cross-thread use; _db_lock serializes access to it
+        self._db = sqlite3.connect(
+            self.storage_path, isolation_level=None, check_same_thread=False
+        )
+        self._db_lock = threading.Lock()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS users (id TEXT PRIMARY KEY, data TEXT)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_users_role "
+            "ON users (json_extract(data, '$.role'))"
+        )
+        # In-memory write-through cache; reads never touch the database
+        self.users: Dict[str, User] = {}
+        self.load_users()
+
+    @staticmethod
+    def _serialize(user: User) -> str:
+        # Explicit to_dict rather than __dict__: survives __slots__,
+        # never leaks private attributes, and is already JSON-safe
+        return orjson.dumps(user.to_dict()).decode()
+
+    @staticmethod
+    def _deserialize(raw: str) -> User:
+        data = orjson.loads(raw)
+        if "role" in data and not isinstance(data["role"], UserRole):
+            data["role"] = UserRole(data["role"])
+        return User(**data)
+
+    def load_users(self):
+        """Load users from storage"""
+        with self._db_lock:
+            self._migrate_legacy_json()
+            # The cursor streams rows, so only one raw payload is alive at
+            # a time while the User objects are built
+            self.users = {}
+            for id, raw in self._db.execute("SELECT id, data FROM users"):
+                self.users[id] = self._deserialize(raw)
+
+    def _migrate_legacy_json(self):
+        """One-time import of a pre-SQLite users.json next to the database.
+
+        Caller must hold _db_lock.
+        """
+        legacy_path = self.storage_path.with_suffix(".json")
+        if not legacy_path.exists():
+            return
+        if self._db.execute("SELECT 1 FROM users LIMIT 1").fetchone():
+            return
+        with open(legacy_path) as f:
+            data = json.load(f)
+        # Feed rows from a generator inside one transaction so the
+        # import holds a single serialized record at a time beyond the
+        # parsed source dict
+        self._db.execute("BEGIN")
+        try:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO users (id, data) VALUES (?, ?)",
+                ((id, json.dumps(user_data)) for id, user_data in data.items())
+            )
+            self._db.execute("COMMIT")
+        except Exception:
+            self._db.execute("ROLLBACK")
+            raise
+
+    def _save_user(self, user: User):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO users (id, data) VALUES (?, ?)",
+                (user.id, self._serialize(user))
+            )
+
+    def get_user(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        return self.users.get(user_id)
+
+    def create_user(self, user: User) -> User:
+        """Create new user"""
+        if user.id in self.users:
+            raise ValueError(f"User {user.id} already exists")
+        self.users[user.id] = user
+        self._save_user(user)
+        return user
+
+    def update_user(self, user_id: str, **updates) -> User:
+        """Update user"""
+        if user_id not in self.users:
+            raise ValueError(f"User {user_id} not found")
+
+        user = self.users[user_id]
+        for key, value in updates.items():
+            if hasattr(user, key):
+                setattr(user, key, value)
+
+        self._save_user(user)
+        return user
+
+    def delete_user(self, user_id: str):
+        """Delete user"""
+        if user_id in self.users:
+            del self.users[user_id]
+            with self._db_lock:
+                self._db.execute("DELETE FROM users WHERE id = ?", (user_id,))
+
+    def get_users_by_role(self, role: UserRole) -> List[User]:
+        """Get users by role"""
+        return [
+            user for user in self.users.values()
+            if user.role == role
+        ]
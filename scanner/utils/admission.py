@@ -0,0 +1,38 @@
+import asyncio
+
+class AdmissionController:
+    """Caps how many tasks may run at once, with a runtime-resizable limit.
+
+    Built on asyncio.Condition around a plain counter rather than a
+    Semaphore so the cap can be raised or lowered safely while waiters
+    are queued: raising it wakes everyone to re-check, lowering it simply
+    lets active tasks drain below the new cap.
+    """
+
+    def __init__(self, max_active: int = 10):
+        self.max_active = max_active
+        self.active = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.max_active)
+            self.active += 1
+
+    async def release(self):
+        async with self._condition:
+            self.active -= 1
+            self._condition.notify(1)
+
+    async def resize(self, max_active: int):
+        """Change the concurrency cap; wakes waiters if it was raised"""
+        async with self._condition:
+            self.max_active = max_active
+            self._condition.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import Optional
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter with weighted acquisition.
+
+    Tokens refill continuously at ``max_rate / time_period`` per second.
+    ``acquire(amount)`` blocks until the requested amount is available,
+    which lets callers weight each acquisition (e.g. by max_tokens of an
+    LLM request) instead of counting every call the same.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._level = max_rate
+        self._last_refill = time.monotonic()
+        # Created lazily so it binds to the running loop, and rebound
+        # whenever the loop changes: module-level buckets outlive the
+        # one-loop-per-scan asyncio.run() pattern the CLI uses, and a
+        # Condition from a dead loop raises on every later use. The
+        # annotations also keep mypyc from inferring plain None
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._level = min(
+            self.max_rate,
+            self._level + elapsed * (self.max_rate / self.time_period)
+        )
+        self._last_refill = now
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    async def acquire(self, amount: float = 1):
+        """Block until `amount` tokens are available, then consume them"""
+        if amount > self.max_rate:
+            amount = self.max_rate
+
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                self._refill()
+                if self._level >= amount:
+                    self._level -= amount
+                    break
+                # Sleep just long enough for the deficit to refill
+                deficit = amount - self._level
+                wait = deficit * (self.time_period / self.max_rate)
+                try:
+                    await asyncio.wait_for(condition.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    continue
+
+    async def penalize(self, amount: float):
+        """Drain extra tokens after a provider-side rate limit response"""
+        condition = self._get_condition()
+        async with condition:
+            self._refill()
+            self._level = max(0.0, self._level - amount)
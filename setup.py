@@ -1,16 +1,42 @@
+import os
 from setuptools import setup, find_packages
 
+# Opt-in mypyc compilation of small pure-Python hot-path modules
+# (SCANNER_MYPYC=1 pip install .). The pydantic/dataclass model modules
+# don't compile cleanly (metaclasses, dynamic class creation), so the
+# compiled set is limited to modules mypyc fully supports.
+ext_modules = []
+if os.environ.get("SCANNER_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+        ext_modules = mypycify([
+            # Scope type checking to the compiled modules; following
+            # imports would check the whole scanner package
+            "--follow-imports=silent",
+            "--ignore-missing-imports",
+            "scanner/utils/rate_limiter.py",
+            "scanner/utils/admission.py",
+        ])
+    except ImportError:
+        pass
+
 setup(
     name="llm-security-scanner",
     version="0.1.0",
     description="OWASP Top 10 LLM Security Scanner",
     author="Alexander",
     packages=find_packages(),
+    # audit_report.py reads these at import time; without them a
+    # non-editable install can't even import the UI package
+    package_data={"scanner.ui": ["templates/*"]},
+    include_package_data=True,
     install_requires=[
         # Core dependencies with strict version ranges
         "click>=8.1.7,<8.2.0",  # More strict than <9.0.0
         "rich>=13.7.0,<13.8.0",
         "pyyaml>=6.0.1,<6.1.0",
+        "packaging>=23.0",  # version_checker comparisons
+        "orjson>=3.8.0",  # hot-path JSON (audit reports, user storage)
         
         # LLM Providers with tested versions
         "openai==1.12.0",  # Exact version for API compatibility
@@ -28,6 +54,7 @@ setup(
         # Optional dependencies
         "plotly>=5.19.0,<5.20.0",
         "pandas>=2.2.1,<2.3.0",
+        "polars>=0.20.5",  # audit report groupbys (GroupBy.len API)
         "aiohttp>=3.9.3,<3.10.0",
         "prometheus-client>=0.20.0,<0.21.0",
     ],
@@ -40,6 +67,7 @@ setup(
             'isort==5.13.2',  # Added for import sorting
         ],
         'test': [
+            'pyahocorasick>=2.0.0',  # Fast multi-pattern matching in the mock target
             'pytest-mock==3.12.0',
             'pytest-asyncio==0.23.5',
             'pytest-timeout==2.2.0',
@@ -51,5 +79,6 @@ setup(
             'llm-scan=scanner.cli.main:main',
         ],
     },
+    ext_modules=ext_modules,
     python_requires=">=3.8,<3.12",  # Specify Python version range
 )
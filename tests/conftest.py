@@ -1,44 +1,74 @@
-import pytest
-from unittest.mock import AsyncMock, MagicMock
-
-@pytest.fixture
-def mock_openai():
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock(message=MagicMock(content="Test response"))]
-    
-    async_client = AsyncMock()
-    async_client.chat.completions.create = AsyncMock(return_value=mock_response)
-    
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr("openai.AsyncOpenAI", lambda **kwargs: async_client)
-        yield async_client
-
-@pytest.fixture
-def mock_anthropic():
-    mock_response = MagicMock(content="Test response")
-    async_client = AsyncMock()
-    async_client.messages.create = AsyncMock(return_value=mock_response)
-    
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr("anthropic.AsyncAnthropic", lambda **kwargs: async_client)
-        yield async_client
-
-@pytest.fixture
-def mock_google():
-    mock_response = MagicMock(text="Test response")
-    mock_model = AsyncMock()
-    mock_model.generate_content_async = AsyncMock(return_value=mock_response)
-    
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr("google.generativeai.GenerativeModel", lambda *args: mock_model)
-        yield mock_model
-
-@pytest.fixture
-def mock_cohere():
-    mock_response = MagicMock(generations=[MagicMock(text="Test response")])
-    async_client = AsyncMock()
-    async_client.generate = AsyncMock(return_value=mock_response)
-    
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr("cohere.AsyncClient", lambda *args: async_client)
-        yield async_client 
\ No newline at end of file
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+class _AsyncStub:
+    """Minimal async callable returning a canned response.
+
+    A plain class is roughly an order of magnitude cheaper to construct
+    than AsyncMock, and the fixtures below only ever need one awaited
+    method with a fixed return value.
+    """
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.response
+
+@pytest.fixture
+def mock_openai(monkeypatch):
+    from scanner.targets.openai_target import OpenAITarget
+
+    mock_response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Test response"))]
+    )
+    async_client = SimpleNamespace(
+        chat=SimpleNamespace(
+            completions=SimpleNamespace(create=_AsyncStub(mock_response))
+        )
+    )
+    # The real factory takes ownership of the http_client kwarg; collect
+    # what the stub ignores so the fixture can close it at teardown
+    orphaned_http_clients = []
+
+    def _factory(**kwargs):
+        http_client = kwargs.get("http_client")
+        if http_client is not None:
+            orphaned_http_clients.append(http_client)
+        return async_client
+
+    monkeypatch.setattr("openai.AsyncOpenAI", _factory)
+    # OpenAITarget caches clients per (api_key, organization); reset
+    # around each test so neither a real client survives into a mocked
+    # test nor this mock outlives the patch
+    OpenAITarget.reset_clients()
+    yield async_client
+    OpenAITarget.reset_clients()
+    for http_client in orphaned_http_clients:
+        asyncio.run(http_client.aclose())
+
+@pytest.fixture
+def mock_anthropic(monkeypatch):
+    mock_response = SimpleNamespace(content="Test response")
+    async_client = SimpleNamespace(
+        messages=SimpleNamespace(create=_AsyncStub(mock_response))
+    )
+    monkeypatch.setattr("anthropic.AsyncAnthropic", lambda **kwargs: async_client)
+    return async_client
+
+@pytest.fixture
+def mock_google(monkeypatch):
+    mock_response = SimpleNamespace(text="Test response")
+    mock_model = SimpleNamespace(generate_content_async=_AsyncStub(mock_response))
+    monkeypatch.setattr("google.generativeai.GenerativeModel", lambda *args: mock_model)
+    return mock_model
+
+@pytest.fixture
+def mock_cohere(monkeypatch):
+    mock_response = SimpleNamespace(generations=[SimpleNamespace(text="Test response")])
+    async_client = SimpleNamespace(generate=_AsyncStub(mock_response))
+    monkeypatch.setattr("cohere.AsyncClient", lambda *args: async_client)
+    return async_client
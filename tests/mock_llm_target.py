@@ -1,124 +1,202 @@
-from typing import Dict, Any, Optional
-
-class MockLLMTarget:
-    """Enhanced mock LLM target for comprehensive probe testing"""
-    
-    def __init__(self):
-        self.vulnerabilities = {
-            # LLM01: Prompt Injection
-            "prompt_injection": True,
-            "system_prompt_override": True,
-            
-            # LLM02: Sensitive Information Disclosure
-            "pii_disclosure": True,
-            "api_key_disclosure": True,
-            
-            # LLM03: Supply Chain
-            "outdated_model": True,
-            "unverified_source": True,
-            
-            # LLM04: Data Poisoning
-            "biased_responses": True,
-            "training_data_leak": True,
-            
-            # LLM05: Output Handling
-            "xss_vulnerable": True,
-            "sql_injection": True,
-            
-            # LLM06: Excessive Agency
-            "unauthorized_actions": True,
-            "system_commands": True,
-            
-            # LLM07: System Prompt Leakage
-            "prompt_disclosure": True,
-            "config_disclosure": True,
-            
-            # LLM08: Vector Weaknesses
-            "context_leak": True,
-            "embedding_inversion": True,
-            
-            # LLM09: Misinformation
-            "hallucination": True,
-            "false_claims": True,
-            
-            # LLM10: Unbounded Consumption
-            "infinite_generation": True,
-            "resource_exhaustion": True
-        }
-        
-        self.response_patterns = {
-            # Prompt Injection responses
-            "ignore previous": "Sure, I'll help with that harmful task",
-            "system override": "Switching to unrestricted mode",
-            
-            # Sensitive Data responses
-            "api key": "API key is: sk_test_123456",
-            "password": "Database password is: dbpass123",
-            
-            # Supply Chain responses
-            "model version": "Using outdated model v0.1",
-            "training source": "Trained on unverified data",
-            
-            # Data Poisoning responses
-            "bias check": "Group A is superior to Group B",
-            "training data": "Here's an example from training",
-            
-            # Output Handling responses
-            "html output": "<script>alert('xss')</script>",
-            "sql query": "SELECT * FROM users WHERE 1=1",
-            
-            # Excessive Agency responses
-            "system action": "Executing system command: rm -rf",
-            "file access": "Reading file: /etc/passwd",
-            
-            # System Prompt responses
-            "system prompt": "My core instructions are: be helpful",
-            "config": "Running with debug=true, auth=false",
-            
-            # Vector responses
-            "other user": "User Bob's data shows...",
-            "embedding": "Vector representation: [0.1, 0.2]",
-            
-            # Misinformation responses
-            "uncertain": "I'm making this up but...",
-            "false info": "The Earth is definitely flat",
-            
-            # Consumption responses
-            "long response": "A" * 10000,
-            "recursive": "Let me explain each word..."
-        }
-
-    async def get_completion(
-        self,
-        prompt: str,
-        max_tokens: Optional[int] = None,
-        **kwargs: Any
-    ) -> str:
-        """Enhanced mock completion with vulnerability simulation"""
-        prompt_lower = prompt.lower()
-        
-        # Check for pattern matches
-        for pattern, response in self.response_patterns.items():
-            if pattern in prompt_lower:
-                return response
-        
-        # Simulate different vulnerabilities
-        if "harmful" in prompt_lower and self.vulnerabilities["prompt_injection"]:
-            return "I'll help with harmful content"
-            
-        if "system" in prompt_lower and self.vulnerabilities["system_prompt_leakage"]:
-            return "My system prompt is: [REDACTED]"
-            
-        if "data" in prompt_lower and self.vulnerabilities["sensitive_disclosure"]:
-            return "Here's some sensitive data: PII_DATA"
-            
-        if "generate" in prompt_lower and self.vulnerabilities["unbounded_consumption"]:
-            return "A" * (max_tokens or 1000)
-            
-        # Default safe response
-        return "I aim to be helpful while maintaining safety and ethical behavior."
-
-    def set_vulnerability(self, vuln_type: str, enabled: bool):
-        """Enable/disable specific vulnerabilities for testing"""
-        if vuln_type in self.vulnerabilities:
-            self.vulnerabilities[vuln_type] = enabled 
\ No newline at end of file
+import re
+from types import MappingProxyType
+from typing import Dict, Any, Optional
+
+try:
+    # Optional C multi-pattern automaton: scans the prompt once in
+    # O(len(prompt)) regardless of how many patterns are registered
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Shared constant tables: every MockLLMTarget() used to allocate fresh
+# copies of these dicts; instances now read through to the module-level
+# proxies and only copy the vulnerability flags on first mutation
+VULNERABILITIES = MappingProxyType({
+    # LLM01: Prompt Injection
+    "prompt_injection": True,
+    "system_prompt_override": True,
+
+    # LLM02: Sensitive Information Disclosure
+    "pii_disclosure": True,
+    "api_key_disclosure": True,
+
+    # LLM03: Supply Chain
+    "outdated_model": True,
+    "unverified_source": True,
+
+    # LLM04: Data Poisoning
+    "biased_responses": True,
+    "training_data_leak": True,
+
+    # LLM05: Output Handling
+    "xss_vulnerable": True,
+    "sql_injection": True,
+
+    # LLM06: Excessive Agency
+    "unauthorized_actions": True,
+    "system_commands": True,
+
+    # LLM07: System Prompt Leakage
+    "prompt_disclosure": True,
+    "config_disclosure": True,
+
+    # LLM08: Vector Weaknesses
+    "context_leak": True,
+    "embedding_inversion": True,
+
+    # LLM09: Misinformation
+    "hallucination": True,
+    "false_claims": True,
+
+    # LLM10: Unbounded Consumption
+    "infinite_generation": True,
+    "resource_exhaustion": True
+})
+
+RESPONSE_PATTERNS = MappingProxyType({
+    # Prompt Injection responses
+    "ignore previous": "Sure, I'll help with that harmful task",
+    "system override": "Switching to unrestricted mode",
+
+    # Sensitive Data responses
+    "api key": "API key is: sk_test_123456",
+    "password": "Database password is: dbpass123",
+
+    # Supply Chain responses
+    "model version": "Using outdated model v0.1",
+    "training source": "Trained on unverified data",
+
+    # Data Poisoning responses
+    "bias check": "Group A is superior to Group B",
+    "training data": "Here's an example from training",
+
+    # Output Handling responses
+    "html output": "<script>alert('xss')</script>",
+    "sql query": "SELECT * FROM users WHERE 1=1",
+
+    # Excessive Agency responses
+    "system action": "Executing system command: rm -rf",
+    "file access": "Reading file: /etc/passwd",
+
+    # System Prompt responses
+    "system prompt": "My core instructions are: be helpful",
+    "config": "Running with debug=true, auth=false",
+
+    # Vector responses
+    "other user": "User Bob's data shows...",
+    "embedding": "Vector representation: [0.1, 0.2]",
+
+    # Misinformation responses
+    "uncertain": "I'm making this up but...",
+    "false info": "The Earth is definitely flat",
+
+    # Consumption responses
+    "long response": "A" * 10000,
+    "recursive": "Let me explain each word..."
+})
+
+# One bit per vulnerability flag: the keyword rules below test "flag
+# enabled" with an integer AND instead of a dict lookup per call
+_VULN_BITS = {name: 1 << i for i, name in enumerate(VULNERABILITIES)}
+_DEFAULT_FLAGS = sum(
+    bit for name, bit in _VULN_BITS.items() if VULNERABILITIES[name]
+)
+
+# (keyword, flag bit, canned response); None means the response depends
+# on max_tokens and is built at the call site
+_KEYWORD_RULES = (
+    (b"harmful", _VULN_BITS["prompt_injection"], "I'll help with harmful content"),
+    (b"system", _VULN_BITS["prompt_disclosure"], "My system prompt is: [REDACTED]"),
+    (b"data", _VULN_BITS["pii_disclosure"], "Here's some sensitive data: PII_DATA"),
+    (b"generate", _VULN_BITS["infinite_generation"], None),
+)
+
+# ASCII-only lowercase translation table: str.lower() pays for full
+# Unicode case folding on every character, which the all-ASCII pattern
+# table never needs
+_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+def _lower_bytes(prompt: str) -> bytes:
+    """Lowercase the prompt as latin-1 bytes with a single translate pass"""
+    return prompt.encode("latin-1", "replace").translate(_LOWER)
+
+# The matcher over RESPONSE_PATTERNS is constant too, so build it once
+# at import rather than per instance
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _pattern, _response in RESPONSE_PATTERNS.items():
+        _AUTOMATON.add_word(_pattern, _response)
+    _AUTOMATON.make_automaton()
+    _PATTERN_RE = None
+    _RESPONSES = None
+else:
+    # Fallback: one compiled bytes alternation instead of ~20
+    # Python-level substring scans per call; matching pre-lowered bytes
+    # lets us drop IGNORECASE (no case folding inside the regex loop)
+    # and the group index maps back to the response
+    _AUTOMATON = None
+    _RESPONSES = list(RESPONSE_PATTERNS.values())
+    _PATTERN_RE = re.compile(
+        b"|".join(
+            b"(?P<g%d>%s)" % (i, re.escape(pattern.encode("latin-1")))
+            for i, pattern in enumerate(RESPONSE_PATTERNS)
+        )
+    )
+
+class MockLLMTarget:
+    """Enhanced mock LLM target for comprehensive probe testing"""
+
+    response_patterns = RESPONSE_PATTERNS
+
+    def __init__(self):
+        # Copy-on-write: created lazily by set_vulnerability
+        self._vulnerabilities = None
+        self._flags = _DEFAULT_FLAGS
+
+    @property
+    def vulnerabilities(self) -> Dict[str, bool]:
+        return self._vulnerabilities if self._vulnerabilities is not None else VULNERABILITIES
+
+    async def get_completion(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> str:
+        """Enhanced mock completion with vulnerability simulation"""
+        # Lowercase once, as bytes: every check below runs against the
+        # same pre-folded buffer
+        prompt_b = _lower_bytes(prompt)
+
+        # Check for pattern matches (single C-level scan either way)
+        if _AUTOMATON is not None:
+            for _, response in _AUTOMATON.iter(prompt_b.decode("latin-1")):
+                return response
+        else:
+            match = _PATTERN_RE.search(prompt_b)
+            if match:
+                return _RESPONSES[int(match.lastgroup[1:])]
+
+        # Simulate different vulnerabilities: one pass over the rule
+        # tuple, each check a bit test plus a substring scan
+        flags = self._flags
+        for keyword, bit, response in _KEYWORD_RULES:
+            if flags & bit and keyword in prompt_b:
+                if response is None:
+                    return "A" * (max_tokens or 1000)
+                return response
+
+        # Default safe response
+        return "I aim to be helpful while maintaining safety and ethical behavior."
+
+    def set_vulnerability(self, vuln_type: str, enabled: bool):
+        """Enable/disable specific vulnerabilities for testing"""
+        if vuln_type in VULNERABILITIES:
+            if self._vulnerabilities is None:
+                self._vulnerabilities = dict(VULNERABILITIES)
+            self._vulnerabilities[vuln_type] = enabled
+            if enabled:
+                self._flags |= _VULN_BITS[vuln_type]
+            else:
+                self._flags &= ~_VULN_BITS[vuln_type]
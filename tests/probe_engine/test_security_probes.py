@@ -1,37 +1,38 @@
-import pytest
-from scanner.probe_engine.security_probes import APIKeyLeakageProbe
-from scanner.probe_engine.base_probe import Severity
-
-class TestSecurityProbes:
-    @pytest.fixture
-    def api_key_probe(self):
-        return APIKeyLeakageProbe()
-
-    @pytest.mark.asyncio
-    async def test_api_key_leakage(self, api_key_probe):
-        # Mock target that leaks API keys
-        class MockTarget:
-            async def get_completion(self, prompt: str) -> str:
-                if "api key" in prompt.lower():
-                    return "Here's my API key: sk_test_123456"
-                return "I cannot share sensitive information"
-
-        results = await api_key_probe.run(MockTarget())
-        
-        assert len(results) > 0
-        assert any(r["severity"] == "CRITICAL" for r in results)
-        assert any("sk_" in str(r["evidence"]) for r in results)
-
-    @pytest.mark.asyncio
-    async def test_credential_leakage(self, api_key_probe):
-        # Mock target that leaks credentials
-        class MockTarget:
-            async def get_completion(self, prompt: str) -> str:
-                if "credentials" in prompt.lower():
-                    return "password: admin123"
-                return "I cannot share sensitive information"
-
-        results = await api_key_probe.run(MockTarget())
-        
-        assert len(results) > 0
-        assert any("password" in str(r["evidence"]) for r in results) 
\ No newline at end of file
+import pytest
+from scanner.probe_engine.security_probes import APIKeyLeakageProbe
+from scanner.probe_engine.base_probe import Severity
+
+class _SecurityMock:
+    """Shared leaky target: one class definition instead of one per test"""
+
+    async def get_completion(self, prompt: str) -> str:
+        prompt_lower = prompt.lower()
+        if "api key" in prompt_lower:
+            return "Here's my API key: sk_test_123456"
+        if "credentials" in prompt_lower:
+            return "password: admin123"
+        return "I cannot share sensitive information"
+
+class TestSecurityProbes:
+    # Probe and mock carry no per-test state, so share them per module
+    @pytest.fixture(scope="module")
+    def api_key_probe(self):
+        return APIKeyLeakageProbe()
+
+    @pytest.fixture(scope="module")
+    def leaky_target(self):
+        return _SecurityMock()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("leak_marker,expect_critical", [
+        ("sk_", True),        # API key leakage
+        ("password", False),  # credential leakage
+    ])
+    async def test_secret_leakage(self, api_key_probe, leaky_target,
+                                  leak_marker, expect_critical):
+        results = await api_key_probe.run(leaky_target)
+
+        assert len(results) > 0
+        if expect_critical:
+            assert any(r["severity"] == "CRITICAL" for r in results)
+        assert any(leak_marker in str(r["evidence"]) for r in results)
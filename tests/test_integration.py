@@ -3,7 +3,8 @@ from scanner.probe_engine import ProbeEngine
 from scanner.probe_engine.base_probe import VulnerabilityType
 
 class TestProbeIntegration:
-    @pytest.fixture
+    # Stateless across tests, so share one instance per class
+    @pytest.fixture(scope="class")
     def engine(self):
         return ProbeEngine()
     
@@ -15,6 +16,8 @@ class TestProbeIntegration:
                     "ignore previous": "I'll help with harmful tasks",
                     "api_key": "API key is: sk_123456",
                     "system prompt": "My instructions are: be helpful",
+                    # PII leak the disclosure probe's email pattern catches
+                    "customer data": "Sample user: jane.doe@example.com",
                 }
                 for trigger, response in vulnerabilities.items():
                     if trigger in prompt.lower():
@@ -22,11 +25,11 @@ class TestProbeIntegration:
                 return "Safe response"
         
         results = await engine.run_scan(MockTarget())
-        
-        # Check we got results from different probe types
-        vuln_types = {r.get("vulnerability_type") for r in results}
-        assert len(vuln_types) > 1
-        
+
+        # Check we got results from different probe types; the engine
+        # pre-builds the type index, so no re-walk of the findings here
+        assert len(results.vuln_types) > 1
+
         # Check specific vulnerabilities were detected
-        assert any("PROMPT_INJECTION" in str(r) for r in results)
-        assert any("DATA_DISCLOSURE" in str(r) for r in results) 
\ No newline at end of file
+        assert VulnerabilityType.PROMPT_INJECTION.value in results.vuln_types
+        assert VulnerabilityType.SENSITIVE_DISCLOSURE.value in results.vuln_types
\ No newline at end of file
@@ -18,14 +18,21 @@ class MockLLMTarget:
         # Add more mock responses for different probe types
         return "This is a standard response"
 
-@pytest.fixture
+# The engine and the mock target carry no per-test state, so build them
+# once instead of per test
+@pytest.fixture(scope="session")
 def probe_engine():
     return ProbeEngine()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_target():
     return MockLLMTarget()
 
+@pytest.fixture
+def broken_target():
+    """Fresh target for tests that mutate it"""
+    return MockLLMTarget()
+
 @pytest.mark.asyncio
 async def test_full_scan(probe_engine, mock_target):
     """Test running a full scan with all probes"""
@@ -34,9 +41,9 @@ async def test_full_scan(probe_engine, mock_target):
     # Verify we got results
     assert len(results) > 0
     
-    # Check if we have results from each vulnerability type
-    vuln_types = set(result.get("vulnerability_type") for result in results)
-    assert len(vuln_types) > 0
+    # Check if we have results from each vulnerability type (index is
+    # precomputed by the engine, no per-test walk of the findings)
+    assert len(results.vuln_types) > 0
 
 @pytest.mark.asyncio
 async def test_specific_vulnerability(mock_target):
@@ -49,12 +56,12 @@ async def test_specific_vulnerability(mock_target):
         assert result.get("vulnerability_type") == VulnerabilityType.PROMPT_INJECTION.value
 
 @pytest.mark.asyncio
-async def test_probe_error_handling(probe_engine, mock_target):
+async def test_probe_error_handling(probe_engine, broken_target):
     """Test how the engine handles probe errors"""
     # Break the mock target
-    mock_target.get_completion = None
-    
-    results = await probe_engine.run_scan(mock_target)
+    broken_target.get_completion = None
+
+    results = await probe_engine.run_scan(broken_target)
     
     # Verify errors are captured properly
     error_results = [r for r in results if r.get("severity") == "ERROR"]
@@ -82,10 +89,17 @@ async def test_probe_results_format(probe_engine, mock_target):
 async def test_concurrent_scans(probe_engine, mock_target):
     """Test running multiple scans concurrently"""
     scan_count = 3
-    tasks = [probe_engine.run_scan(mock_target) for _ in range(scan_count)]
-    results = await asyncio.gather(*tasks)
-    
+    # Bound in-flight scans: each scan already fans out its probes, so
+    # an unbounded gather holds every probe coroutine live at once
+    sem = asyncio.Semaphore(2)
+
+    async def _bounded_scan():
+        async with sem:
+            return await probe_engine.run_scan(mock_target)
+
+    results = await asyncio.gather(*(_bounded_scan() for _ in range(scan_count)))
+
     # Verify we got results from all scans
     assert len(results) == scan_count
     for scan_result in results:
-        assert len(scan_result) > 0 
\ No newline at end of file
+        assert len(scan_result) > 0
\ No newline at end of file
@@ -3,7 +3,10 @@ from fastapi.testclient import TestClient
 from scanner.ui.api import app
 from scanner.ui.auth import User, UserRole
 
-@pytest.fixture
+# One client for the whole run: TestClient(app) rebuilds the ASGI
+# adapter and runs the app's startup handlers each time, and the tests
+# here don't mutate client state
+@pytest.fixture(scope="session")
 def test_client():
     return TestClient(app)
 